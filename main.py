@@ -10,6 +10,7 @@ from json_schema_for_humans.generation_configuration import GenerationConfigurat
 from pydantic import BaseModel
 from stringcase import spinalcase
 
+from server import serve
 from settings import conf
 
 app = typer.Typer()
@@ -17,10 +18,12 @@ app = typer.Typer()
 convert_src_to_json_schema_app = typer.Typer()
 convert_json_schema_to_html_app = typer.Typer()
 convert_src_to_html_app = typer.Typer()
+serve_html_app = typer.Typer()
 
 app.add_typer(convert_src_to_json_schema_app, name="convert-src-to-json-schema")
 app.add_typer(convert_json_schema_to_html_app, name="convert-json-schema-to-html")
 app.add_typer(convert_src_to_html_app, name="convert-src-to-html")
+app.add_typer(serve_html_app, name="serve-html")
 
 
 def convert_src_path_to_schema_path(src_file_path: Path) -> Path:
@@ -84,17 +87,13 @@ class CustomGenerationConfiguration(GenerationConfiguration):
         return [*files, *self.extra_files_to_copy]
 
 
-@convert_json_schema_to_html_app.callback(
-    invoke_without_command=True,
-    help="Convert JSON Schema files to HTML",
-)
-def convert_json_schema_to_html() -> None:
+def get_generation_config() -> CustomGenerationConfiguration:
     """
-    Convert JSON Schema files to HTML using JSON Schema for Humans.
+    Get the configuration used for rendering the JSON Schema files to HTML.
 
-    :return:
+    :return: The generation configuration built from the settings.
     """
-    config = CustomGenerationConfiguration(
+    return CustomGenerationConfiguration(
         collapse_long_examples=False,
         collapse_long_descriptions=False,
         expand_buttons=True,
@@ -105,6 +104,18 @@ def convert_json_schema_to_html() -> None:
         extra_files_to_copy=conf.EXTRA_TEMPLATE_FILES_TO_COPY,
     )
 
+
+@convert_json_schema_to_html_app.callback(
+    invoke_without_command=True,
+    help="Convert JSON Schema files to HTML",
+)
+def convert_json_schema_to_html() -> None:
+    """
+    Convert JSON Schema files to HTML using JSON Schema for Humans.
+
+    :return:
+    """
+    config = get_generation_config()
     for schema_file in conf.SCHEMAS_PATH.glob("*.json"):
         generate_from_filename(schema_file, conf.HTML_PATH, config=config)
 
@@ -123,5 +134,26 @@ def convert_src_to_html() -> None:
     convert_json_schema_to_html()
 
 
+@serve_html_app.callback(
+    invoke_without_command=True,
+    help="Serve the JSON Schema files as HTML, rendering pages on demand",
+)
+def serve_html(
+    host: str = typer.Option("127.0.0.1", help="Address to listen on"),
+    port: int = typer.Option(8000, help="Port to listen on"),
+) -> None:
+    """
+    Serve the JSON Schema files as HTML without pre-rendering them.
+
+    Each page is rendered the first time it's requested and kept in a cache until
+    the schema, the templates or the settings change.
+
+    :param host: The address to listen on.
+    :param port: The port to listen on.
+    :return:
+    """
+    serve(get_generation_config(), host, port)
+
+
 if __name__ == "__main__":
     app()
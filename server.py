@@ -0,0 +1,225 @@
+import hashlib
+import html
+import json
+import mimetypes
+import threading
+import traceback
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+import typer
+from json_schema_for_humans.generate import generate_from_schema
+from json_schema_for_humans.generation_configuration import GenerationConfiguration
+
+from settings import conf
+
+
+def hash_file(path: Path) -> str:
+    """
+    Calculate a hash of the contents of a file.
+
+    :param path: The path to the file.
+    :return: The hex digest of the file contents.
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def hash_directory(path: Path) -> str:
+    """
+    Calculate a hash of the names and contents of all files in a directory.
+
+    :param path: The path to the directory.
+    :return: The hex digest of the directory contents.
+    """
+    digest = hashlib.sha256()
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        digest.update(str(file.relative_to(path)).encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def get_directory_signature(path: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Get a cheap signature of a directory that changes when any file in it is added,
+    removed or modified.
+
+    :param path: The path to the directory.
+    :return: The name, modification time and size of each file in the directory.
+    """
+    signature = []
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        stat = file.stat()
+        signature.append((str(file), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class PageRenderer:
+    """
+    Renders the JSON Schema files to HTML on demand and keeps the rendered pages in an
+    LRU cache keyed by the hashes of the schema, the templates and the settings.
+
+    The cache is cleared whenever the schemas or the templates directory change.
+    """
+
+    def __init__(
+        self, config: GenerationConfiguration, schemas_path: Path, cache_size: int
+    ):
+        self.config = config
+        self.schemas_path = schemas_path.resolve()
+        self.template_dir = config.template_path.parent.resolve()
+        self.settings_hash = hashlib.sha256(
+            json.dumps(config.to_dict(), sort_keys=True, default=str).encode()
+        ).hexdigest()
+        self._lock = threading.Lock()
+        self._signature: Optional[tuple] = None
+        self._template_hash: Optional[str] = None
+        self._render = lru_cache(maxsize=cache_size)(self._render_page)
+
+    def _refresh(self) -> str:
+        """
+        Clear the cache if the schemas or the templates have changed.
+
+        :return: The hash of the current templates.
+        """
+        signature = (
+            get_directory_signature(self.schemas_path),
+            get_directory_signature(self.template_dir),
+        )
+        with self._lock:
+            if signature != self._signature:
+                self._render.cache_clear()
+                self._template_hash = hash_directory(self.template_dir)
+                self._signature = signature
+            return self._template_hash
+
+    def _render_page(
+        self,
+        schema_file: Path,
+        schema_hash: str,
+        template_hash: str,
+        settings_hash: str,
+    ) -> bytes:
+        """
+        Render a schema to HTML. Wrapped in an LRU cache in __init__.
+
+        The hash arguments aren't used for rendering, they exist only to form the
+        cache key so a changed schema, template or setting never hits a stale entry.
+
+        :param schema_file: The path to the JSON Schema file.
+        :param schema_hash: The hash of the schema file contents.
+        :param template_hash: The hash of the template directory contents.
+        :param settings_hash: The hash of the generation configuration.
+        :return: The rendered page.
+        """
+        return generate_from_schema(schema_file, config=self.config).encode()
+
+    def render(self, name: str) -> Optional[bytes]:
+        """
+        Get the rendered HTML page for a schema, rendering it if it's not cached.
+
+        :param name: The name of the schema file without the extension.
+        :return: The rendered page or None if there's no such schema.
+        """
+        schema_file = self.schemas_path / f"{name}.json"
+        if schema_file.parent != self.schemas_path or not schema_file.is_file():
+            return None
+        template_hash = self._refresh()
+        return self._render(
+            schema_file, hash_file(schema_file), template_hash, self.settings_hash
+        )
+
+    def render_index(self) -> bytes:
+        """
+        Get an HTML page linking to the pages of all the schemas, without rendering
+        any of them.
+
+        :return: The index page.
+        """
+        links = "".join(
+            f'<li><a href="{quote(p.stem)}.html">{html.escape(p.stem)}</a></li>'
+            for p in sorted(self.schemas_path.glob("*.json"))
+        )
+        return (
+            "<!DOCTYPE html><html><head><title>Schemas</title></head>"
+            f"<body><h1>Schemas</h1><ul>{links}</ul></body></html>"
+        ).encode()
+
+    def get_static_file(self, name: str) -> Optional[Path]:
+        """
+        Get the path to a static asset in the template directory.
+
+        :param name: The name of the file.
+        :return: The path to the file or None if it's not a static asset.
+        """
+        if name not in self.config.files_to_copy:
+            return None
+        path = self.template_dir / name
+        return path if path.is_file() else None
+
+
+class PageServer(ThreadingHTTPServer):
+    def __init__(self, server_address: Tuple[str, int], renderer: PageRenderer):
+        super().__init__(server_address, PageRequestHandler)
+        self.renderer = renderer
+
+
+class PageRequestHandler(BaseHTTPRequestHandler):
+    server: PageServer
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool) -> None:
+        name = unquote(urlsplit(self.path).path).lstrip("/")
+        renderer = self.server.renderer
+
+        body: Optional[bytes] = None
+        content_type = "text/html; charset=utf-8"
+        if not name:
+            body = renderer.render_index()
+        elif name.endswith(".html"):
+            try:
+                body = renderer.render(name[: -len(".html")])
+            except Exception as e:
+                self.log_error("Failed to render %s: %r", name, e)
+                traceback.print_exc()
+                self.send_error(
+                    HTTPStatus.INTERNAL_SERVER_ERROR, f"Failed to render {name}", str(e)
+                )
+                return
+        elif static_file := renderer.get_static_file(name):
+            body = static_file.read_bytes()
+            content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+        if body is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+def serve(config: GenerationConfiguration, host: str, port: int) -> None:
+    """
+    Serve the JSON Schema files as HTML pages that are rendered when first requested.
+
+    :param config: The configuration to render the pages with.
+    :param host: The address to listen on.
+    :param port: The port to listen on.
+    :return:
+    """
+    renderer = PageRenderer(config, conf.SCHEMAS_PATH, conf.RENDER_CACHE_SIZE)
+    with PageServer((host, port), renderer) as httpd:
+        typer.echo(f"Serving on http://{host}:{port}/")
+        httpd.serve_forever()
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
         "favicon.ico",
         "jquery-3.4.1.min.js",
     ]
+    RENDER_CACHE_SIZE: int = 128
 
     DOCUMENTATION_HUB_URL: Optional[
         HttpUrl